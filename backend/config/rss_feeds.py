@@ -2,9 +2,9 @@
 RSS Feeds Configuration
 """
 
-from typing import Dict, List, NamedTuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
 from enum import Enum
-from pydantic import BaseModel
 
 
 class NewsCategory(str, Enum):
@@ -13,11 +13,17 @@ class NewsCategory(str, Enum):
     VIETNAMESE_NEWS = "Vietnamese News"
     US_NEWS = "US News"
 
-class RSSFeed(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class RSSFeed:
     name: str
     url: str
     category: NewsCategory
     is_active: bool = True
+    # Precomputed at construction so name lookups never re-lowercase
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "name_lower", self.name.lower())
 
 # RSS Feeds Configuration
 RSS_FEEDS: Dict[NewsCategory, List[RSSFeed]] = {
@@ -98,33 +104,32 @@ RSS_FEEDS: Dict[NewsCategory, List[RSSFeed]] = {
     ]    
 }
 
-class RSSFeedCreate(BaseModel):
-    name: str
-    url: str
-    category: NewsCategory
+# Flat view of RSS_FEEDS, built once at import since the config is static
+_ALL_FEEDS: Tuple[RSSFeed, ...] = tuple(
+    feed for category_feeds in RSS_FEEDS.values() for feed in category_feeds
+)
+
 
-def get_all_feeds() -> List[RSSFeed]:
-    """Get all RSS feeds as a flat list."""
-    all_feeds = []
-    for category_feeds in RSS_FEEDS.values():
-        all_feeds.extend(category_feeds)
-    return all_feeds
+def get_all_feeds() -> Sequence[RSSFeed]:
+    """Get all RSS feeds as a flat, read-only sequence."""
+    return _ALL_FEEDS
 
 
-def get_active_feeds() -> List[RSSFeed]:
-    """Get all active RSS feeds as a flat list."""
-    all_feeds = []
-    for category_feeds in RSS_FEEDS.values():
-        all_feeds.extend([feed for feed in category_feeds if feed.is_active])
-    return all_feeds
+_ACTIVE_FEEDS: Tuple[RSSFeed, ...] = tuple(feed for feed in _ALL_FEEDS if feed.is_active)
+
+
+def get_active_feeds() -> Sequence[RSSFeed]:
+    """Get all active RSS feeds as a flat, read-only sequence."""
+    return _ACTIVE_FEEDS
+
+
+# Lowercased feed name -> feed, built once at import for O(1) lookups
+_FEEDS_BY_LOWER_NAME: Dict[str, RSSFeed] = {feed.name_lower: feed for feed in _ALL_FEEDS}
 
 
 def get_feed_by_name(name: str) -> RSSFeed | None:
-    """Get a specific RSS feed by name."""
-    for feed in get_all_feeds():
-        if feed.name.lower() == name.lower():
-            return feed
-    return None
+    """Get a specific RSS feed by name (case-insensitive)."""
+    return _FEEDS_BY_LOWER_NAME.get(name.lower())
 
 
 # TODO: The following functions are defined for future use but not currently used in the codebase
@@ -134,19 +139,30 @@ def get_feed_by_name(name: str) -> RSSFeed | None:
 #     """Get RSS feeds for a specific category."""
 #     return RSS_FEEDS.get(category, [])
 
+# def _rebuild_all_feeds() -> None:
+#     """Rebuild the cached flat feed tuple after RSS_FEEDS is mutated."""
+#     global _ALL_FEEDS, _ACTIVE_FEEDS
+#     _ALL_FEEDS = tuple(feed for category_feeds in RSS_FEEDS.values() for feed in category_feeds)
+#     _ACTIVE_FEEDS = tuple(feed for feed in _ALL_FEEDS if feed.is_active)
+
 # def add_feed(feed: RSSFeed) -> None:
 #     """Add a new RSS feed to the configuration."""
 #     if feed.category not in RSS_FEEDS:
 #         RSS_FEEDS[feed.category] = []
 #     RSS_FEEDS[feed.category].append(feed)
+#     _FEEDS_BY_LOWER_NAME[feed.name_lower] = feed
+#     _rebuild_all_feeds()
 
 # def remove_feed(name: str) -> bool:
 #     """Remove an RSS feed by name."""
+#     target_lower = name.lower()
 #     for category in RSS_FEEDS:
 #         RSS_FEEDS[category] = [
 #             feed for feed in RSS_FEEDS[category] 
-#             if feed.name.lower() != name.lower()
+#             if feed.name_lower != target_lower
 #         ]
+#     _FEEDS_BY_LOWER_NAME.pop(target_lower, None)
+#     _rebuild_all_feeds()
 #     return True
 
 # def update_feed(name: str, updated_feed: RSSFeed) -> bool:
@@ -2,9 +2,11 @@
 Database configuration and session management.
 """
 
-from sqlalchemy import create_engine
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, Iterator
 import os
 from pathlib import Path
 import logging
@@ -15,9 +17,12 @@ logger = logging.getLogger(__name__)
 def get_database_url() -> str:
     """
     Get the database URL based on environment.
+    An explicit DATABASE_URL takes precedence (e.g. a throwaway test database)
     The persistent disk can be mounted at /app/data
     For local development, use the current directory
     """
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
     persistent_data_path = "/app/data"
     if os.path.exists(persistent_data_path):
         # Ensure the data directory exists
@@ -32,13 +37,39 @@ def get_database_url() -> str:
 DATABASE_URL = get_database_url()
 logger.info(f"Using database: {DATABASE_URL}")
 
-# Create engine
+# Create engine. SQLite is a local file, so there is no server-side connection
+# that can go stale; pool_pre_ping would only add a SELECT 1 to every checkout
+# and pool_recycle is unnecessary. The pool is sized for threadpool-served
+# requests plus scheduler jobs; LIFO keeps reusing the connections whose page
+# cache is already warm and lets the rest sit idle
+POOL_SIZE = 10
+MAX_OVERFLOW = 20
+
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},
-    pool_pre_ping=True
+    pool_pre_ping=False,
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
+    pool_timeout=10,
+    pool_use_lifo=True
 )
 
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tune every new SQLite connection. WAL lets API readers run while the
+        RSS fetcher is writing, and NORMAL sync is safe in WAL mode.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+        cursor.execute("PRAGMA cache_size=-64000")  # ~64MB
+        cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Dependency for FastAPI
@@ -50,12 +81,50 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Provide a transactional session for non-HTTP code paths (scheduler jobs,
+    startup, scripts). Commits on success, rolls back on error, always closes.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def run_db(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run blocking database work from an `async def` handler in the threadpool,
+    so the event loop keeps serving other requests while SQLite is busy.
+    """
+    return await run_in_threadpool(fn, *args, **kwargs)
+
 def init_db():
     """
-    Initialize the database (create tables if not exist).
+    Initialize the database (create tables if not exist) and upgrade the schema
+    of databases created by older versions of the app.
     """
     from models.database import Base
+    from models.migrations import upgrade_schema
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        upgrade_schema(conn)
+
+def warm_pool() -> None:
+    """
+    Open the pool's steady-state connections up front so the first burst of
+    requests doesn't pay connection setup (and the PRAGMAs above) on checkout.
+    """
+    size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    connections = [engine.connect() for _ in range(size)]
+    for connection in connections:
+        connection.close()  # returned to the pool, still open
+    logger.info("Warmed database pool with %d connections", size)
 
 def get_db_url() -> str:
     """
@@ -0,0 +1,88 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Small in-process cache whose entries expire after a fixed number of seconds.
+    Used to keep frequently polled, read-only endpoints off the database.
+
+    With a stale_ttl, expired entries are kept that much longer so
+    get_or_compute() can serve them while a single caller refreshes the value.
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, threading.Lock] = {}
+        # Bumped by clear(), so a computation that overlapped an invalidation
+        # doesn't cache what it read before the write
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        now = time.monotonic()
+        if now >= expires_at:
+            if now >= expires_at + self.stale_ttl:
+                self._entries.pop(key, None)
+            return None
+        return value
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, computing and caching it on a miss.
+        Only one caller computes a given key at a time: the others get the stale
+        value if there is one, or wait for the computation otherwise.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        stale = self._entries.get(key)
+        if stale is not None and time.monotonic() >= stale[0] + self.stale_ttl:
+            stale = None
+        lock = self._locks.setdefault(key, threading.Lock())
+        if not lock.acquire(blocking=stale is None):
+            return stale[1]
+        try:
+            # Another caller may have refreshed it while we waited for the lock
+            value = self.get(key)
+            if value is None:
+                generation = self._generation
+                value = compute()
+                if generation == self._generation:
+                    self.set(key, value)
+            return value
+        finally:
+            lock.release()
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for the configured TTL."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a write that changes the cached data."""
+        self._generation += 1
+        self._entries.clear()
+
+
+# Caches for read-mostly endpoints, invalidated on feed/article writes. The TTL
+# only bounds staleness from writes that don't invalidate (content extraction)
+health_cache = TTLCache(ttl=10)
+feeds_cache = TTLCache(ttl=60)
+# Stats are the most expensive to rebuild, so expired ones are served for up to
+# 10 minutes while a single request refreshes them
+stats_cache = TTLCache(ttl=120, stale_ttl=600)
+
+
+def invalidate_feed_caches() -> None:
+    """Clear the caches whose contents depend on feeds or articles."""
+    health_cache.clear()
+    feeds_cache.clear()
+    stats_cache.clear()
@@ -1,29 +1,43 @@
-import re
-import random
+import hashlib
+import secrets
 import string
 from typing import Optional
 
+# Folds A-Z to lowercase and deletes every other ASCII character that is not
+# allowed in the title part of a slug
+_SLUG_ALLOWED = string.ascii_letters + string.digits
+_SLUG_TABLE = str.maketrans(
+    string.ascii_uppercase,
+    string.ascii_lowercase,
+    ''.join(chr(c) for c in range(128) if chr(c) not in _SLUG_ALLOWED)
+)
 
-def generate_slug(title: str, article_id: Optional[int] = None) -> str:
+
+def generate_slug(title: str, article_id: Optional[int] = None, random_bytes: int = 4) -> str:
     """
     Generate a URL-friendly slug from an article title.
-    Format: first 15 characters of title + 8 random alphanumeric characters
+    Format: first 15 characters of title + 8 random hex characters
     
     Args:
         title: The article title
         article_id: Optional article ID to ensure uniqueness
+        random_bytes: Number of random bytes in the suffix (2 hex characters each)
     
     Returns:
         A URL-friendly slug
     """
-    # Clean the title: remove special characters, convert to lowercase
-    clean_title = re.sub(r'[^a-zA-Z0-9\s]', '', title.lower())
+    # Clean the title: ASCII titles go straight to the translate table, which also
+    # lowercases them. Otherwise lowercase first and drop non-ASCII characters
+    if title.isascii():
+        clean_title = title
+    else:
+        clean_title = title.lower().encode('ascii', 'ignore').decode('ascii')
     
-    # Take first 15 characters, remove extra spaces
-    title_part = re.sub(r'\s+', '', clean_title)[:15]
+    # Strip whitespace and special characters, take first 15 characters
+    title_part = clean_title.translate(_SLUG_TABLE)[:15]
     
-    # Generate 8 random alphanumeric characters
-    random_part = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+    # Generate the random hex suffix (8 characters by default)
+    random_part = secrets.token_hex(random_bytes)
     
     # Combine title part and random part
     slug = f"{title_part}{random_part}"
@@ -45,14 +59,49 @@ def generate_unique_slug(title: str, existing_slugs: set, article_id: Optional[i
     """
     max_attempts = 10
     for attempt in range(max_attempts):
-        slug = generate_slug(title, article_id)
+        # Widen the random part on later attempts so a further collision is practically impossible
+        random_bytes = 4 if attempt < 5 else 8
+        slug = generate_slug(title, article_id, random_bytes)
         if slug not in existing_slugs:
             return slug
     
-    # If we still have conflicts after max attempts, add a number
+    # If we still have conflicts after max attempts, add a number. Start from the
+    # set size so we don't probe 1, 2, 3... one by one on every call
     base_slug = generate_slug(title, article_id)
-    counter = 1
+    counter = len(existing_slugs)
     while f"{base_slug}{counter}" in existing_slugs:
         counter += 1
     
-    return f"{base_slug}{counter}" 
\ No newline at end of file
+    return f"{base_slug}{counter}" 
+
+
+def hash_link(link: str) -> int:
+    """
+    Compute a compact 64-bit key for an article link.
+    Used as the deduplication key instead of indexing the full URL.
+    
+    Args:
+        link: The article URL
+    
+    Returns:
+        A signed 64-bit integer (fits SQLite's INTEGER / BIGINT)
+    """
+    digest = hashlib.blake2b(link.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def count_words(content: Optional[str]) -> Optional[int]:
+    """
+    Approximate the word count of article content (spaces + 1).
+    Stored alongside the content so list pages can show a read time without
+    loading it; must match the SQL backfill in models.migrations.
+    
+    Args:
+        content: The article content
+    
+    Returns:
+        The approximate word count, or None if there is no content
+    """
+    if not content:
+        return None
+    return content.count(' ') + 1
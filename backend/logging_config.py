@@ -2,10 +2,11 @@
 Logging configuration for the news aggregation system.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
-from datetime import datetime
+import queue
 from typing import Optional, Dict, Any
 import json
 from pathlib import Path
@@ -14,6 +15,19 @@ from pathlib import Path
 logs_dir = Path("logs")
 logs_dir.mkdir(exist_ok=True)
 
+# Noisy third-party loggers and the level they are capped at
+LOGGING_LEVELS: Dict[str, int] = {
+    "httpx": logging.WARNING,
+    "httpcore": logging.WARNING,
+    "apscheduler": logging.WARNING,
+    "sqlalchemy.engine": logging.WARNING,
+    "urllib3": logging.WARNING,
+}
+
+# Background listener that owns the real (blocking) handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -41,14 +55,19 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Clear existing handlers
+    # Clear existing handlers and stop a listener from a previous call
+    global _queue_listener
     root_logger.handlers.clear()
+    if _queue_listener is not None:
+        atexit.unregister(_queue_listener.stop)
+        _queue_listener.stop()
+        _queue_listener = None
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
     
     # File handler (if log_file is specified)
     if log_file:
@@ -65,17 +84,27 @@ def setup_logging(
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-    
-    # Set specific logging levels for third-party libraries
+        handlers.append(file_handler)
+    
+    # Loggers only enqueue records; writes and rotation happen on the listener's
+    # thread so the event loop never blocks on disk I/O
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+    
+    # Set specific logging levels for third-party libraries. Handlers live on the
+    # root logger only; named loggers propagate to it, so attaching the same
+    # handlers to them as well would write every record more than once
     for logger_name, level in LOGGING_LEVELS.items():
         logging.getLogger(logger_name).setLevel(level)
     
     # Log startup message
     logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured with level: {log_level}")
+    logger.info("Logging configured with level: %s", log_level)
     if log_file:
-        logger.info(f"Log file: {log_file}")
+        logger.info("Log file: %s", log_file)
 
 
 def log_request(request, response=None, error=None):
@@ -88,9 +117,11 @@ def log_request(request, response=None, error=None):
         error: Exception object (optional)
     """
     logger = logging.getLogger("http")
+    level = logging.ERROR if error else logging.INFO
+    if not logger.isEnabledFor(level):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
         "method": request.method,
         "url": str(request.url),
         "client_ip": request.client.host if request.client else "unknown",
@@ -109,10 +140,8 @@ def log_request(request, response=None, error=None):
             "error_type": type(error).__name__
         })
     
-    if error:
-        logger.error(f"Request failed: {json.dumps(log_data)}")
-    else:
-        logger.info(f"Request completed: {json.dumps(log_data)}")
+    message = "Request failed: %s" if error else "Request completed: %s"
+    logger.log(level, message, json.dumps(log_data))
 
 
 def log_content_extraction(url, success, content_length=0, embedded_images=0, standalone_images=0, error=None):
@@ -128,9 +157,11 @@ def log_content_extraction(url, success, content_length=0, embedded_images=0, st
         error: Exception object (optional)
     """
     logger = logging.getLogger("content_extraction")
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
         "url": url,
         "success": success,
         "content_length": content_length,
@@ -144,10 +175,8 @@ def log_content_extraction(url, success, content_length=0, embedded_images=0, st
             "error_type": type(error).__name__
         })
     
-    if success:
-        logger.info(f"Content extraction successful: {json.dumps(log_data)}")
-    else:
-        logger.error(f"Content extraction failed: {json.dumps(log_data)}")
+    message = "Content extraction successful: %s" if success else "Content extraction failed: %s"
+    logger.log(level, message, json.dumps(log_data))
 
 
 def log_feed_fetch(feed_name, success, articles_found=0, articles_processed=0, error=None):
@@ -162,9 +191,11 @@ def log_feed_fetch(feed_name, success, articles_found=0, articles_processed=0, e
         error: Exception object (optional)
     """
     logger = logging.getLogger("feed_fetch")
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
         "feed_name": feed_name,
         "success": success,
         "articles_found": articles_found,
@@ -177,10 +208,8 @@ def log_feed_fetch(feed_name, success, articles_found=0, articles_processed=0, e
             "error_type": type(error).__name__
         })
     
-    if success:
-        logger.info(f"Feed fetch successful: {json.dumps(log_data)}")
-    else:
-        logger.error(f"Feed fetch failed: {json.dumps(log_data)}")
+    message = "Feed fetch successful: %s" if success else "Feed fetch failed: %s"
+    logger.log(level, message, json.dumps(log_data))
 
 
 def log_database_operation(operation, table, success, rows_affected=0, error=None):
@@ -195,9 +224,11 @@ def log_database_operation(operation, table, success, rows_affected=0, error=Non
         error: Exception object (optional)
     """
     logger = logging.getLogger("database")
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
     
     log_data = {
-        "timestamp": datetime.now().isoformat(),
         "operation": operation,
         "table": table,
         "success": success,
@@ -210,7 +241,5 @@ def log_database_operation(operation, table, success, rows_affected=0, error=Non
             "error_type": type(error).__name__
         })
     
-    if success:
-        logger.info(f"Database operation successful: {json.dumps(log_data)}")
-    else:
-        logger.error(f"Database operation failed: {json.dumps(log_data)}") 
\ No newline at end of file
+    message = "Database operation successful: %s" if success else "Database operation failed: %s"
+    logger.log(level, message, json.dumps(log_data)) 
\ No newline at end of file
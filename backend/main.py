@@ -4,13 +4,18 @@ Main FastAPI application for the News 4U RSS aggregator.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
+import anyio.to_thread
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from database import init_db, get_db
+from database import MAX_OVERFLOW, POOL_SIZE, init_db, session_scope, warm_pool
 from routers import news
 from config.rss_feeds import get_all_feeds
+from models.database import RSSFeed
+from services.rss_service import close_http_client
 from services.scheduler_service import scheduler_service
 import logging
 
@@ -24,25 +29,24 @@ async def lifespan(app: FastAPI):
 
     logger.info("Starting News 4U RSS Aggregator...")
     init_db()
+    warm_pool()
+    # Sync endpoints and run_db() share this threadpool. Size it to the
+    # connection pool: more threads would only queue on pool checkout
+    anyio.to_thread.current_default_thread_limiter().total_tokens = POOL_SIZE + MAX_OVERFLOW
     logger.info("Database initialized")
     
-    from models.database import RSSFeed
-    db = next(get_db())
-    try:
-        feeds = get_all_feeds()
-        for feed in feeds:
-            existing = db.query(RSSFeed).filter(RSSFeed.name == feed.name).first()
-            if not existing:
-                db_feed = RSSFeed(
-                    name=feed.name,
-                    url=feed.url,
-                    category=feed.category.value
-                )
-                db.add(db_feed)
-        db.commit()
-        logger.info(f"Loaded {len(feeds)} RSS feeds")
-    finally:
-        db.close()
+    # Seed configured feeds in one statement; existing rows (matched on the
+    # unique name) are left untouched
+    feeds = get_all_feeds()
+    rows = [
+        {"name": feed.name, "url": feed.url, "category": feed.category.value}
+        for feed in feeds
+    ]
+    with session_scope() as db:
+        db.execute(
+            sqlite_insert(RSSFeed).values(rows).on_conflict_do_nothing(index_elements=["name"])
+        )
+    logger.info("Loaded %d RSS feeds", len(feeds))
     
     # Start the scheduler
     scheduler_service.start()
@@ -53,6 +57,7 @@ async def lifespan(app: FastAPI):
     # Stop the scheduler
     scheduler_service.stop()
     logger.info("Scheduler stopped")
+    await close_http_client()
     logger.info("Shutting down News 4U RSS Aggregator...")
 
 
@@ -62,9 +67,13 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Article lists are repetitive JSON and compress well; small bodies aren't worth it
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -74,8 +83,9 @@ app.add_middleware(
         "https://news-4u.vercel.app"
     ],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE", "OPTIONS"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 app.include_router(news.router)
@@ -95,7 +105,7 @@ async def root():
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
     """Global HTTP exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.detail,
@@ -107,7 +117,7 @@ async def http_exception_handler(request, exc):
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
     """Global exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -2,7 +2,7 @@
 Database models for the news aggregation system.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy import BigInteger, Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,10 +15,10 @@ class RSSFeed(Base):
     """Model for storing RSS feed information."""
     __tablename__ = "rss_feeds"
     
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False, unique=True, index=True)
     url = Column(String(500), nullable=False)
-    category = Column(String(50), nullable=False, index=True)
+    category = Column(String(50), nullable=False)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -38,38 +38,147 @@ class NewsArticle(Base):
     """Model for storing processed news articles."""
     __tablename__ = "news_articles"
     
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    title = Column(String(500), nullable=False, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    title = Column(String(500), nullable=False)
     summary = Column(Text)
     content = Column(Text)
-    link = Column(String(1000), nullable=False, unique=True, index=True)
+    # Approximate word count of content (see lib.utils.count_words); written
+    # with content so list pages can show a read time without reading it
+    content_word_count = Column(Integer)
+    link = Column(String(1000), nullable=False)
+    # 64-bit hash of link (see lib.utils.hash_link); deduplication key
+    link_hash = Column(BigInteger, nullable=False, unique=True, index=True)
     author = Column(String(255))
     published_date = Column(DateTime(timezone=True))
-    category = Column(String(50), nullable=False, index=True)
-    source_name = Column(String(255), nullable=False, index=True)
+    category = Column(String(50), nullable=False)
+    source_name = Column(String(255), nullable=False)
     source_url = Column(String(500))
     image_url = Column(String(1000))
     slug = Column(String(100), unique=True, index=True)
     is_processed = Column(Boolean, default=False)
+    # Last content extraction attempt, successful or not (retry cooldown)
+    extraction_attempted_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     __table_args__ = (
-        Index('idx_article_category', 'category'),
-        Index('idx_article_source', 'source_name'),
-        Index('idx_article_published', 'published_date'),
+        # Listing indexes: an optional equality filter followed by the full
+        # listing ORDER BY (incl. the id tiebreak), so pages and keyset seeks are
+        # read in order from the index with no sort step. The filtered ones also
+        # serve plain category / source_name lookups
+        Index(
+            'idx_article_category_published_created',
+            'category', published_date.desc(), created_at.desc(), id.desc()
+        ),
+        Index(
+            'idx_article_source_published_created',
+            'source_name', published_date.desc(), created_at.desc(), id.desc()
+        ),
+        Index(
+            'idx_article_published_created',
+            published_date.desc(), created_at.desc(), id.desc()
+        ),
+        # Newest-ingested articles (stats)
+        Index('idx_article_created', created_at.desc()),
+        # Content extraction job's retry cooldown filter
+        Index('idx_article_extraction_attempted', 'extraction_attempted_at'),
         Index('idx_article_processed', 'is_processed'),
         Index('idx_article_title', 'title'),
-        Index('idx_article_slug', 'slug'),
     )
 
 
+# SQLite FTS5 index over article text, used by /search. External-content table:
+# it stores only the inverted index and is kept in sync by triggers. Created by
+# init_db() (models/migrations.py), which also covers existing databases
+ARTICLE_SEARCH_TABLE = "news_articles_fts"
+
+ARTICLE_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {ARTICLE_SEARCH_TABLE}
+    USING fts5(title, summary, content, content='news_articles', content_rowid='id')
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {ARTICLE_SEARCH_TABLE}_ai AFTER INSERT ON news_articles BEGIN
+        INSERT INTO {ARTICLE_SEARCH_TABLE}(rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {ARTICLE_SEARCH_TABLE}_ad AFTER DELETE ON news_articles BEGIN
+        INSERT INTO {ARTICLE_SEARCH_TABLE}({ARTICLE_SEARCH_TABLE}, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {ARTICLE_SEARCH_TABLE}_au AFTER UPDATE OF title, summary, content ON news_articles BEGIN
+        INSERT INTO {ARTICLE_SEARCH_TABLE}({ARTICLE_SEARCH_TABLE}, rowid, title, summary, content)
+        VALUES ('delete', old.id, old.title, old.summary, old.content);
+        INSERT INTO {ARTICLE_SEARCH_TABLE}(rowid, title, summary, content)
+        VALUES (new.id, new.title, new.summary, new.content);
+    END
+    """,
+]
+
+
+# Per-category and per-source article counts for /stats, kept current by
+# triggers so reading them doesn't need GROUP BY scans over news_articles.
+# Rows whose count drops to zero are removed, matching what GROUP BY would
+# return. Created by init_db() (models/migrations.py), like the search index
+ARTICLE_COUNTS_TABLE = "article_counts"
+
+ARTICLE_COUNTS_DDL = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {ARTICLE_COUNTS_TABLE} (
+        dimension VARCHAR(20) NOT NULL,
+        name VARCHAR(255) NOT NULL,
+        article_count INTEGER NOT NULL,
+        PRIMARY KEY (dimension, name)
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {ARTICLE_COUNTS_TABLE}_ai AFTER INSERT ON news_articles BEGIN
+        INSERT INTO {ARTICLE_COUNTS_TABLE}(dimension, name, article_count) VALUES ('category', new.category, 1)
+        ON CONFLICT(dimension, name) DO UPDATE SET article_count = article_count + 1;
+        INSERT INTO {ARTICLE_COUNTS_TABLE}(dimension, name, article_count) VALUES ('source', new.source_name, 1)
+        ON CONFLICT(dimension, name) DO UPDATE SET article_count = article_count + 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {ARTICLE_COUNTS_TABLE}_ad AFTER DELETE ON news_articles BEGIN
+        UPDATE {ARTICLE_COUNTS_TABLE} SET article_count = article_count - 1
+        WHERE (dimension = 'category' AND name = old.category)
+           OR (dimension = 'source' AND name = old.source_name);
+        DELETE FROM {ARTICLE_COUNTS_TABLE}
+        WHERE article_count <= 0
+          AND ((dimension = 'category' AND name = old.category)
+            OR (dimension = 'source' AND name = old.source_name));
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {ARTICLE_COUNTS_TABLE}_au AFTER UPDATE OF category, source_name ON news_articles
+    WHEN old.category IS NOT new.category OR old.source_name IS NOT new.source_name BEGIN
+        UPDATE {ARTICLE_COUNTS_TABLE} SET article_count = article_count - 1
+        WHERE (dimension = 'category' AND name = old.category)
+           OR (dimension = 'source' AND name = old.source_name);
+        INSERT INTO {ARTICLE_COUNTS_TABLE}(dimension, name, article_count) VALUES ('category', new.category, 1)
+        ON CONFLICT(dimension, name) DO UPDATE SET article_count = article_count + 1;
+        INSERT INTO {ARTICLE_COUNTS_TABLE}(dimension, name, article_count) VALUES ('source', new.source_name, 1)
+        ON CONFLICT(dimension, name) DO UPDATE SET article_count = article_count + 1;
+        DELETE FROM {ARTICLE_COUNTS_TABLE}
+        WHERE article_count <= 0
+          AND ((dimension = 'category' AND name = old.category)
+            OR (dimension = 'source' AND name = old.source_name));
+    END
+    """,
+]
+
+
 class FeedFetchLog(Base):
     """Model for logging RSS feed fetch operations."""
     __tablename__ = "feed_fetch_logs"
     
-    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    feed_name = Column(String(255), nullable=False, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    feed_name = Column(String(255), nullable=False)
     fetch_timestamp = Column(DateTime(timezone=True), server_default=func.now())
     status = Column(String(50), nullable=False)  # success, error, partial
     articles_found = Column(Integer, default=0)
@@ -0,0 +1,130 @@
+"""
+Idempotent schema upgrades applied by init_db().
+
+create_all() only creates missing tables, so databases created by an older
+version of the app are brought up to date here: missing columns are added and
+backfilled. Every step checks the current schema first and is safe to run on
+each startup, on new and existing databases alike.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from lib.utils import hash_link
+from models.database import (
+    ARTICLE_COUNTS_DDL,
+    ARTICLE_COUNTS_TABLE,
+    ARTICLE_SEARCH_DDL,
+    ARTICLE_SEARCH_TABLE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def column_exists(conn: Connection, table_name: str, column_name: str) -> bool:
+    """Check whether a table has the given column."""
+    return conn.execute(
+        text("SELECT COUNT(*) FROM pragma_table_info(:table_name) WHERE name = :column_name"),
+        {"table_name": table_name, "column_name": column_name}
+    ).scalar() > 0
+
+
+def table_exists(conn: Connection, table_name: str) -> bool:
+    """Check whether a table (including a virtual table) exists."""
+    return conn.execute(
+        text("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = :table_name"),
+        {"table_name": table_name}
+    ).scalar() > 0
+
+
+def add_link_hash_column(conn: Connection) -> None:
+    """Add and backfill link_hash, then move uniqueness from link to link_hash."""
+    if not column_exists(conn, "news_articles", "link_hash"):
+        logger.info("Adding link_hash column to news_articles table...")
+        conn.execute(text("ALTER TABLE news_articles ADD COLUMN link_hash BIGINT"))
+
+    # Backfill hashes for rows that don't have one yet (uses the link_hash index
+    # once it exists, so this is cheap on every later startup)
+    rows = conn.execute(text("SELECT id, link FROM news_articles WHERE link_hash IS NULL")).fetchall()
+    if rows:
+        logger.info(f"Backfilling link_hash for {len(rows)} articles...")
+        conn.execute(
+            text("UPDATE news_articles SET link_hash = :link_hash WHERE id = :id"),
+            [{"id": row.id, "link_hash": hash_link(row.link)} for row in rows]
+        )
+
+    # Make link_hash the unique key and drop the wide unique index on link
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_news_articles_link_hash ON news_articles(link_hash)"
+    ))
+    conn.execute(text("DROP INDEX IF EXISTS ix_news_articles_link"))
+
+
+def add_extraction_attempted_column(conn: Connection) -> None:
+    """Add extraction_attempted_at (content extraction retry cooldown) and its index."""
+    if not column_exists(conn, "news_articles", "extraction_attempted_at"):
+        logger.info("Adding extraction_attempted_at column to news_articles table...")
+        conn.execute(text("ALTER TABLE news_articles ADD COLUMN extraction_attempted_at DATETIME"))
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS idx_article_extraction_attempted ON news_articles(extraction_attempted_at)"
+    ))
+
+
+def add_content_word_count_column(conn: Connection) -> None:
+    """Add content_word_count and fill it in for articles that already have content."""
+    if column_exists(conn, "news_articles", "content_word_count"):
+        return
+    logger.info("Adding content_word_count column to news_articles table...")
+    conn.execute(text("ALTER TABLE news_articles ADD COLUMN content_word_count INTEGER"))
+    # Same approximation as lib.utils.count_words
+    conn.execute(text("""
+        UPDATE news_articles
+        SET content_word_count = length(content) - length(replace(content, ' ', '')) + 1
+        WHERE length(content) > 0
+    """))
+
+
+def add_article_search_index(conn: Connection) -> None:
+    """Create the FTS5 search table and its sync triggers, indexing existing articles."""
+    created = not table_exists(conn, ARTICLE_SEARCH_TABLE)
+    for statement in ARTICLE_SEARCH_DDL:
+        conn.execute(text(statement))
+    if created:
+        # The triggers only cover later writes; index what is already there
+        logger.info(f"Building {ARTICLE_SEARCH_TABLE} from existing articles...")
+        conn.execute(text(f"INSERT INTO {ARTICLE_SEARCH_TABLE}({ARTICLE_SEARCH_TABLE}) VALUES ('rebuild')"))
+
+
+def add_article_counts(conn: Connection) -> None:
+    """Create the article_counts table and its triggers, counting existing articles."""
+    created = not table_exists(conn, ARTICLE_COUNTS_TABLE)
+    for statement in ARTICLE_COUNTS_DDL:
+        conn.execute(text(statement))
+    if created:
+        # Seeded in the same transaction the triggers are created in, so no
+        # article is counted twice or missed
+        logger.info(f"Filling {ARTICLE_COUNTS_TABLE} from existing articles...")
+        conn.execute(text(f"""
+            INSERT INTO {ARTICLE_COUNTS_TABLE}(dimension, name, article_count)
+            SELECT 'category', category, COUNT(*) FROM news_articles GROUP BY category
+            UNION ALL
+            SELECT 'source', source_name, COUNT(*) FROM news_articles GROUP BY source_name
+        """))
+
+
+# Applied in order; later steps may rely on earlier ones
+UPGRADE_STEPS = [
+    add_link_hash_column,
+    add_extraction_attempted_column,
+    add_content_word_count_column,
+    add_article_search_index,
+    add_article_counts,
+]
+
+
+def upgrade_schema(conn: Connection) -> None:
+    """Run every upgrade step against the connection (one transaction)."""
+    for step in UPGRADE_STEPS:
+        step(conn)
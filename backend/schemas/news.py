@@ -2,7 +2,7 @@
 Pydantic schemas for API request/response models.
 """
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from typing import Optional, List
 from datetime import datetime
 from config.rss_feeds import NewsCategory
@@ -38,7 +38,6 @@ class RSSFeedResponse(RSSFeedBase):
 class NewsArticleBase(BaseModel):
     title: str
     summary: Optional[str] = None
-    content: Optional[str] = None
     link: str
     author: Optional[str] = None
     published_date: Optional[datetime] = None
@@ -50,10 +49,11 @@ class NewsArticleBase(BaseModel):
 
 
 class NewsArticleCreate(NewsArticleBase):
-    pass
+    content: Optional[str] = None
 
 
-class NewsArticleResponse(NewsArticleBase):
+class NewsArticleInDB(NewsArticleBase):
+    """Fields every stored article has; content is added only where it is returned."""
     id: int
     is_processed: bool
     created_at: datetime
@@ -63,12 +63,36 @@ class NewsArticleResponse(NewsArticleBase):
         from_attributes = True
 
 
+class NewsArticleResponse(NewsArticleInDB):
+    content: Optional[str] = None
+
+
+class NewsArticleListItem(NewsArticleInDB):
+    """Article as listed: everything but content, which only detail views return."""
+    # Lets clients show a read time without the content itself
+    content_word_count: Optional[int] = None
+
+
 class NewsArticleList(BaseModel):
-    articles: List[NewsArticleResponse]
-    total: int
+    articles: List[NewsArticleListItem]
+    # None when the request passed include_total=false
+    total: Optional[int] = None
     page: int
     per_page: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_next: bool = False
+    has_prev: bool = False
+    # Keyset cursor for the next page; None on the last page
+    next_cursor: Optional[str] = None
+
+
+class ArticleExtractBatchRequest(BaseModel):
+    article_ids: List[int] = Field(..., min_length=1, max_length=50)
+
+
+class ArticleExtractBatchResponse(BaseModel):
+    articles: List[NewsArticleResponse]
+    extracted_count: int
 
 
 class FeedFetchLogResponse(BaseModel):
@@ -86,11 +110,14 @@ class FeedFetchLogResponse(BaseModel):
 
 
 class HealthCheckResponse(BaseModel):
+    # healthy, degraded (database reachable but schema incomplete) or unhealthy
     status: str
     timestamp: datetime
     database_connected: bool
     feeds_count: int
     articles_count: int
+    # What went wrong when status isn't healthy
+    detail: Optional[str] = None
 
 
 class ErrorResponse(BaseModel):
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add the trigger-maintained article_counts table.
+Creates the table and its triggers on news_articles, then fills it from the
+existing articles.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from models.database import ARTICLE_COUNTS_DDL, ARTICLE_COUNTS_TABLE
+from sqlalchemy import text
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def add_article_counts():
+    """Create the article_counts table and triggers, and count existing articles."""
+    try:
+        with engine.connect() as conn:
+            logger.info(f"Creating {ARTICLE_COUNTS_TABLE} table and triggers...")
+            for statement in ARTICLE_COUNTS_DDL:
+                conn.execute(text(statement))
+            
+            # Recount from news_articles (safe to re-run)
+            logger.info(f"Filling {ARTICLE_COUNTS_TABLE} from existing articles...")
+            conn.execute(text(f"DELETE FROM {ARTICLE_COUNTS_TABLE}"))
+            conn.execute(text(f"""
+                INSERT INTO {ARTICLE_COUNTS_TABLE}(dimension, name, article_count)
+                SELECT 'category', category, COUNT(*) FROM news_articles GROUP BY category
+                UNION ALL
+                SELECT 'source', source_name, COUNT(*) FROM news_articles GROUP BY source_name
+            """))
+            
+            conn.commit()
+            logger.info("Successfully added article counts")
+            
+    except Exception as e:
+        logger.error(f"Error adding article counts: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    add_article_counts()
+    logger.info("Database migration completed!")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add the FTS5 search index on news_articles.
+Creates the news_articles_fts table and its sync triggers, then builds the index
+from the existing articles.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from models.database import ARTICLE_SEARCH_DDL, ARTICLE_SEARCH_TABLE
+from sqlalchemy import text
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def add_article_search_index():
+    """Create the FTS5 search table and triggers, and index existing articles."""
+    try:
+        with engine.connect() as conn:
+            logger.info(f"Creating {ARTICLE_SEARCH_TABLE} table and triggers...")
+            for statement in ARTICLE_SEARCH_DDL:
+                conn.execute(text(statement))
+            
+            # Rebuild the index from news_articles (safe to re-run)
+            logger.info(f"Building {ARTICLE_SEARCH_TABLE} from existing articles...")
+            conn.execute(text(
+                f"INSERT INTO {ARTICLE_SEARCH_TABLE}({ARTICLE_SEARCH_TABLE}) VALUES ('rebuild')"
+            ))
+            
+            conn.commit()
+            logger.info("Successfully added article search index")
+            
+    except Exception as e:
+        logger.error(f"Error adding article search index: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    add_article_search_index()
+    logger.info("Database migration completed!")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add the content_word_count column to news_articles.
+The column stores an approximate word count of the content so list endpoints
+can report a read time without reading the content itself.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from models.migrations import add_content_word_count_column as upgrade_content_word_count
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def add_content_word_count_column():
+    """Add content_word_count column to news_articles table and backfill it."""
+    try:
+        with engine.begin() as conn:
+            upgrade_content_word_count(conn)
+        logger.info("Successfully added content_word_count column to news_articles table")
+            
+    except Exception as e:
+        logger.error(f"Error adding content_word_count column: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    add_content_word_count_column()
+    logger.info("Database migration completed!")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add the extraction_attempted_at column to news_articles.
+The column records the last content extraction attempt so failed extractions
+are retried only after a cooldown.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from models.migrations import add_extraction_attempted_column as upgrade_extraction_attempted
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def add_extraction_attempted_column():
+    """Add extraction_attempted_at column (and its index) to news_articles table."""
+    try:
+        with engine.begin() as conn:
+            upgrade_extraction_attempted(conn)
+        logger.info("Successfully added extraction_attempted_at column to news_articles table")
+            
+    except Exception as e:
+        logger.error(f"Error adding extraction_attempted_at column: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    add_extraction_attempted_column()
+    logger.info("Database migration completed!")
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Database migration script to add the link_hash column to news_articles.
+Backfills the hash for existing rows, makes it the unique deduplication key and
+drops the unique index on the full link URL.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from models.migrations import add_link_hash_column as upgrade_link_hash
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def add_link_hash_column():
+    """Add and backfill link_hash, then move uniqueness from link to link_hash."""
+    try:
+        with engine.begin() as conn:
+            upgrade_link_hash(conn)
+        logger.info("Successfully added link_hash column to news_articles table")
+            
+    except Exception as e:
+        logger.error(f"Error adding link_hash column: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    add_link_hash_column()
+    logger.info("Database migration completed!")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Database migration script to bring news_articles list indexes up to date.
+Creates the composite indexes used by the article listing endpoints and drops
+the single-column indexes they supersede.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from sqlalchemy import text
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Indexes matching the listing queries' WHERE + ORDER BY (and the stats
+# endpoint's newest-first lookup)
+INDEXES_TO_CREATE = {
+    "idx_article_category_published_created": """
+        CREATE INDEX IF NOT EXISTS idx_article_category_published_created
+        ON news_articles (category, published_date DESC, created_at DESC, id DESC)
+    """,
+    "idx_article_source_published_created": """
+        CREATE INDEX IF NOT EXISTS idx_article_source_published_created
+        ON news_articles (source_name, published_date DESC, created_at DESC, id DESC)
+    """,
+    "idx_article_published_created": """
+        CREATE INDEX IF NOT EXISTS idx_article_published_created
+        ON news_articles (published_date DESC, created_at DESC, id DESC)
+    """,
+    "idx_article_created": """
+        CREATE INDEX IF NOT EXISTS idx_article_created
+        ON news_articles (created_at DESC)
+    """,
+}
+
+# Indexes that are a prefix of (or were replaced by) one of the composite indexes
+INDEXES_TO_DROP = [
+    "idx_article_category",
+    "idx_article_category_published",
+    "idx_article_source",
+    "idx_article_published",
+]
+
+
+def migrate_article_list_indexes():
+    """Create composite listing indexes and drop the ones they supersede."""
+    try:
+        with engine.connect() as conn:
+            for index_name, create_sql in INDEXES_TO_CREATE.items():
+                logger.info(f"Creating index {index_name}...")
+                conn.execute(text(create_sql))
+            
+            for index_name in INDEXES_TO_DROP:
+                logger.info(f"Dropping superseded index {index_name}...")
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            
+            conn.commit()
+            logger.info("Successfully migrated news_articles list indexes")
+            
+    except Exception as e:
+        logger.error(f"Error migrating news_articles list indexes: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    migrate_article_list_indexes()
+    logger.info("Database migration completed!")
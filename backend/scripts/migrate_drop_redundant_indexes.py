@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Database migration script to drop redundant indexes.
+Older schemas created both an inline ix_* index and a named idx_* index on the
+same column, plus indexes on INTEGER PRIMARY KEY columns, which SQLite already
+indexes as the rowid. Every extra index is another B-tree to update on insert.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import engine
+from sqlalchemy import text
+import logging
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Indexes that duplicate another index (or the rowid) on the same column
+REDUNDANT_INDEXES = [
+    "ix_rss_feeds_id",
+    "ix_rss_feeds_category",
+    "ix_news_articles_id",
+    "ix_news_articles_title",
+    "ix_news_articles_category",
+    "ix_news_articles_source_name",
+    "idx_article_slug",
+    "ix_feed_fetch_logs_id",
+    "ix_feed_fetch_logs_feed_name",
+]
+
+
+def index_exists(conn, index_name: str) -> bool:
+    """Check whether an index exists in the database."""
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE type = 'index' AND name = :name
+    """), {"name": index_name})
+    count = result.scalar()
+    return count is not None and count > 0
+
+
+def drop_redundant_indexes():
+    """Drop indexes that duplicate an existing index on the same column."""
+    try:
+        with engine.connect() as conn:
+            for index_name in REDUNDANT_INDEXES:
+                if index_exists(conn, index_name):
+                    logger.info(f"Dropping redundant index {index_name}...")
+                    conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            
+            # Databases migrated with migrate_add_slug_column.py have their unique
+            # slug index under this name; only drop it if ix_news_articles_slug exists
+            if index_exists(conn, "ix_news_articles_slug") and index_exists(conn, "idx_article_slug_unique"):
+                logger.info("Dropping redundant index idx_article_slug_unique...")
+                conn.execute(text("DROP INDEX IF EXISTS idx_article_slug_unique"))
+            
+            conn.commit()
+            logger.info("Successfully dropped redundant indexes")
+            
+    except Exception as e:
+        logger.error(f"Error dropping redundant indexes: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    logger.info("Starting database migration...")
+    drop_redundant_indexes()
+    logger.info("Database migration completed!")
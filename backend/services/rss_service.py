@@ -4,7 +4,7 @@ RSS service for fetching and processing RSS feeds.
 
 import asyncio
 from datetime import timezone
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import re
 import time
@@ -15,9 +15,10 @@ from bs4 import BeautifulSoup
 from dateutil import parser as dateutil_parser
 
 from config.rss_feeds import NewsCategory, RSSFeed
+from database import run_db
 import feedparser
 import httpx
-from lib.utils import generate_unique_slug
+from lib.utils import generate_unique_slug, hash_link
 from models.database import FeedFetchLog, NewsArticle, RSSFeed as RSSFeedModel
 from newspaper import Article, Config
 from services.site_extractors import site_extractor_manager
@@ -27,6 +28,51 @@ from sqlalchemy.orm import Session
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for per-entry / per-article text processing
+_GMT_OFFSET_RE = re.compile(r'GMT([+-])(\d{1,2})')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
+
+# Articles whose content extraction failed are not retried before this elapses
+EXTRACTION_RETRY_COOLDOWN = timedelta(hours=6)
+
+# Rows removed per transaction by the admin cleanup methods
+CLEANUP_DELETE_BATCH_SIZE = 10000
+
+# One HTTP client for all feed and article requests, so repeated requests to
+# the same sites reuse pooled keep-alive connections instead of paying DNS,
+# TCP and TLS setup every time. Created lazily on the running event loop
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def needs_content_extraction(article: NewsArticle) -> bool:
+    """Whether an article has no content and is not in its retry cooldown."""
+    if article.content and article.content.strip():
+        return False
+    attempted_at = article.extraction_attempted_at
+    return attempted_at is None or attempted_at < datetime.now() - EXTRACTION_RETRY_COOLDOWN
+
 
 class RSSService:
     """Service for handling RSS feed operations."""
@@ -58,53 +104,20 @@ class RSSService:
         Fetch RSS feed asynchronously.
         """
         start_time = time.time()
-        log_entry = FeedFetchLog(
-            feed_name=feed.name,
-            status="fetching",
-            articles_found=0,
-            articles_processed=0
-        )
-        if self.db is not None:
-            self.db.add(log_entry)
-            self.db.commit()
         
         try:
             logger.info(f'---- Fetching feed from {feed.name} ----')
             response = await self._fetch_with_retry(feed.url)
             
-            # Parse feed
-            parsed_feed = feedparser.parse(response.text)
-            articles_found = len(parsed_feed.entries)
-            logger.info(f'---- Found {articles_found} articles from {feed.name} ----')
-            
-            # Process articles
-            articles_processed = await self._process_articles_batch(parsed_feed.entries, feed)
-            
-            # Update log
-            execution_time = int((time.time() - start_time) * 1000)
-            object.__setattr__(log_entry, 'status', 'success')  # type: ignore
-            object.__setattr__(log_entry, 'articles_found', articles_found)  # type: ignore
-            object.__setattr__(log_entry, 'articles_processed', articles_processed)  # type: ignore
-            object.__setattr__(log_entry, 'execution_time', execution_time)  # type: ignore
-            
-            if self.db is not None:
-                self.db.commit()
-            
-            return {
-                "status": "success",
-                "articles_found": articles_found,
-                "articles_processed": articles_processed,
-                "execution_time": execution_time
-            }
+            # Parsing and the database writes block (CPU, SQLite); run them in
+            # the threadpool so the event loop keeps serving requests
+            return await run_db(self._store_feed, feed, response.text, start_time)
             
         except Exception as e:
             logger.error(f"Error fetching feed {feed.name}: {e}")
             execution_time = int((time.time() - start_time) * 1000)
-            object.__setattr__(log_entry, 'status', 'error')  # type: ignore
-            object.__setattr__(log_entry, 'error_message', str(e))  # type: ignore
-            object.__setattr__(log_entry, 'execution_time', execution_time)  # type: ignore
             if self.db is not None:
-                self.db.commit()
+                await run_db(self._log_fetch_error, feed, str(e), execution_time)
             
             return {
                 "status": "error",
@@ -112,6 +125,49 @@ class RSSService:
                 "execution_time": execution_time
             }
     
+    def _store_feed(self, feed: RSSFeed, feed_text: str, start_time: float) -> Dict:
+        """Parse a fetched feed, insert its new articles and log the fetch."""
+        # Parse feed
+        parsed_feed = feedparser.parse(feed_text)
+        articles_found = len(parsed_feed.entries)
+        logger.info(f'---- Found {articles_found} articles from {feed.name} ----')
+        
+        # Process articles
+        articles_processed = self._process_articles_batch(parsed_feed.entries, feed)
+        
+        # Log the fetch in the same transaction as the new articles: one
+        # commit per feed instead of one each for the log, articles and update
+        execution_time = int((time.time() - start_time) * 1000)
+        if self.db is not None:
+            self.db.add(FeedFetchLog(
+                feed_name=feed.name,
+                status="success",
+                articles_found=articles_found,
+                articles_processed=articles_processed,
+                execution_time=execution_time
+            ))
+            self.db.commit()
+        
+        return {
+            "status": "success",
+            "articles_found": articles_found,
+            "articles_processed": articles_processed,
+            "execution_time": execution_time
+        }
+    
+    def _log_fetch_error(self, feed: RSSFeed, error_message: str, execution_time: int) -> None:
+        """Discard the failed fetch's pending writes and log the error."""
+        self.db.rollback()
+        self.db.add(FeedFetchLog(
+            feed_name=feed.name,
+            status="error",
+            articles_found=0,
+            articles_processed=0,
+            error_message=error_message,
+            execution_time=execution_time
+        ))
+        self.db.commit()
+    
     async def fetch_all_feeds(self) -> Dict:
         """
         Fetch all active RSS feeds.
@@ -119,7 +175,7 @@ class RSSService:
         if self.db is None:
             return {"status": "error", "message": "No database connection"}
         
-        db_feeds = self.db.query(RSSFeedModel).filter(RSSFeedModel.is_active == True).all()
+        db_feeds = await run_db(self.db.query(RSSFeedModel).filter(RSSFeedModel.is_active == True).all)
         
         results = []
         for db_feed in db_feeds:
@@ -148,58 +204,91 @@ class RSSService:
         Extract full article content from URL using multiple strategies.
         """
         try:
-            async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-                try: 
-                    response = await client.get(article_url)
-                    response.raise_for_status()
-                except Exception as e:
-                    logger.error(f"Error fetching article from {article_url}: {e}. trying with headers")
-                    response = await client.get(article_url, headers=self._headers)
-                    response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                extracted_image_url = self._extract_main_image_url_from_html(response.text, article_url)
-                extractor = site_extractor_manager.get_extractor(article_url)
-                
-                if extractor:
-                    logger.info(f"---- Extracting content with {extractor.__class__.__name__} ----")
-                    content = extractor.extract_content(soup, article_url)
-                    if content:
-                        return self._clean_extracted_content(content), extracted_image_url
-                
-                # Fallback to Newspaper3k
-                content = await self._extract_with_newspaper3k(article_url)
-                return content, extracted_image_url
+            client = get_http_client()
+            try: 
+                response = await client.get(article_url, timeout=15)
+                response.raise_for_status()
+            except Exception as e:
+                logger.error(f"Error fetching article from {article_url}: {e}. trying with headers")
+                response = await client.get(article_url, headers=self._headers, timeout=15)
+                response.raise_for_status()
+            
+            # Parsed once (lxml is much faster than html.parser) and shared by
+            # the image lookup and the site extractor
+            soup = BeautifulSoup(response.text, 'lxml')
+            
+            extracted_image_url = self._extract_main_image_url(soup, article_url)
+            extractor = site_extractor_manager.get_extractor(article_url)
+            
+            if extractor:
+                logger.info(f"---- Extracting content with {extractor.__class__.__name__} ----")
+                content = extractor.extract_content(soup, article_url)
+                if content:
+                    return self._clean_extracted_content(content), extracted_image_url
+            
+            # Fallback to Newspaper3k, on the page we already downloaded
+            content = await self._extract_with_newspaper3k(article_url, response.text)
+            return content, extracted_image_url
         except Exception as e:
             logger.error(f"Error extracting content from {article_url}: {e}")
             return None, None
     
-    async def cleanup_all_data(self):
+    async def extract_articles_content(
+        self, article_urls: List[str], max_concurrency: int = 8
+    ) -> List[tuple[Optional[str], Optional[str]]]:
+        """
+        Extract content for several article URLs concurrently.
+        Results are in input order; failed extractions come back as (None, None).
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def extract(article_url: str) -> tuple[Optional[str], Optional[str]]:
+            async with semaphore:
+                return await self.extract_article_content(article_url)
+        
+        return list(await asyncio.gather(*(extract(url) for url in article_urls)))
+    
+    def cleanup_all_data(self):
         """
         Clean up all data from the database.
         """
         if self.db is not None:
-            self.db.query(NewsArticle).delete()
-            self.db.query(FeedFetchLog).delete()
-            self.db.commit()
+            self._delete_in_chunks(NewsArticle)
+            self._delete_in_chunks(FeedFetchLog)
 
-    async def cleanup_feed_data(self, feed_name: str):
+    def cleanup_feed_data(self, feed_name: str):
         """
         Clean up data for a specific feed.
         """
         if self.db is not None:
-            self.db.query(NewsArticle).filter(NewsArticle.source_name == feed_name).delete()
-            self.db.query(FeedFetchLog).filter(FeedFetchLog.feed_name == feed_name).delete()
+            self._delete_in_chunks(NewsArticle, NewsArticle.source_name == feed_name)
+            self._delete_in_chunks(FeedFetchLog, FeedFetchLog.feed_name == feed_name)
+    
+    def _delete_in_chunks(self, model, *criteria) -> int:
+        """
+        Delete matching rows in batches, committing after each one. Keeps every
+        write transaction (and the SQLite write lock) short so readers and the
+        feed fetcher aren't blocked for the whole cleanup. Returns rows deleted.
+        """
+        deleted_count = 0
+        while True:
+            chunk_ids = self.db.query(model.id).filter(*criteria).limit(CLEANUP_DELETE_BATCH_SIZE).subquery()
+            deleted = self.db.query(model).filter(
+                model.id.in_(self.db.query(chunk_ids.c.id))
+            ).delete(synchronize_session=False)
             self.db.commit()
+            deleted_count += deleted
+            if deleted < CLEANUP_DELETE_BATCH_SIZE:
+                return deleted_count
     
-    async def delete_article_content(self, article_id: int):
+    def delete_article_content(self, article_id: int):
         """
         Delete content for a specific article.
         """
         if self.db is not None:
             self.db.query(NewsArticle).filter(NewsArticle.id == article_id).update({
                 NewsArticle.content: None,
+                NewsArticle.content_word_count: None,
                 NewsArticle.image_url: None
             })
             self.db.commit()
@@ -238,6 +327,14 @@ class RSSService:
             NewsArticle.published_date.desc()
         ).limit(limit).all()
     
+    def get_all_feeds(self) -> List[RSSFeedModel]:
+        """
+        Get all RSS feeds from database.
+        """
+        if self.db is None:
+            return []
+        return self.db.query(RSSFeedModel).all()
+    
     def get_feed_by_name_from_db(self, name: str) -> RSSFeedModel | None:
         """
         Get a specific RSS feed from database by name.
@@ -288,14 +385,9 @@ class RSSService:
         """
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.timeout, 
-                    follow_redirects=True,
-                    headers=self._headers
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    return response
+                response = await get_http_client().get(url, headers=self._headers, timeout=self.timeout)
+                response.raise_for_status()
+                return response
                     
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 403 and attempt < max_retries - 1:
@@ -314,7 +406,7 @@ class RSSService:
         
         raise Exception(f"Failed to fetch {url} and all fallbacks after {max_retries} attempts each")
     
-    async def _process_articles_batch(self, entries: List, feed: RSSFeed) -> int:
+    def _process_articles_batch(self, entries: List, feed: RSSFeed) -> int:
         """
         Process RSS feed entries into news articles (metadata only, no content extraction).
         Handles robust deduplication using ON CONFLICT and efficient batch insertion.
@@ -355,6 +447,7 @@ class RSSService:
                     summary=summary,
                     content=None,  # Will be None
                     link=link,
+                    link_hash=hash_link(link),
                     author=author,
                     published_date=published_date,
                     category=feed.category.value,
@@ -393,14 +486,12 @@ class RSSService:
                 return 0
 
             insert_stmt = sqlite_insert(NewsArticle).values(article_dicts)
-            on_conflict_stmt = insert_stmt.on_conflict_do_nothing(index_elements=['link'])
+            on_conflict_stmt = insert_stmt.on_conflict_do_nothing(index_elements=['link_hash'])
             
+            # Committed by the caller together with the feed's fetch log
             if self.db is not None:
                 self.db.execute(on_conflict_stmt)
 
-            if self.db is not None:
-                self.db.commit()
-
             processed_successfully_count = len(articles_to_add)
 
             logger.info(f"Successfully attempted to add {processed_successfully_count} articles from {feed.name}.")
@@ -413,7 +504,7 @@ class RSSService:
 
         return processed_successfully_count
     
-    async def _extract_with_newspaper3k(self, article_url: str) -> Optional[str]:
+    async def _extract_with_newspaper3k(self, article_url: str, html: Optional[str] = None) -> Optional[str]:
         try:
 
             config = Config()
@@ -422,8 +513,9 @@ class RSSService:
             config.memoize_articles = False
             
             article = Article(article_url, config=config)
-            article.download()
-            article.parse()
+            # newspaper3k downloads (unless given html) with blocking requests and
+            # parses synchronously; keep both off the event loop
+            await asyncio.to_thread(self._download_and_parse, article, html)
             
             if hasattr(article, 'text') and article.text:
                 cleaned_text = self._clean_extracted_content(article.text)
@@ -434,6 +526,11 @@ class RSSService:
             logger.error(f"Error extracting content with Newspaper3k from {article_url}: {e}")
         
         return None
+    
+    @staticmethod
+    def _download_and_parse(article: Article, html: Optional[str] = None) -> None:
+        article.download(input_html=html)
+        article.parse()
         
     def _get_cached_existing_slugs(self) -> set:
         """
@@ -466,8 +563,8 @@ class RSSService:
         summary = self._safe_get_string(entry, 'summary') or self._safe_get_string(entry, 'description')
         
         if summary:
-            # Clean HTML tags
-            soup = BeautifulSoup(summary, 'html.parser')
+            # Clean HTML tags (lxml: a C parser, much faster than html.parser)
+            soup = BeautifulSoup(summary, 'lxml')
             return soup.get_text().strip()
         
         return None
@@ -487,9 +584,8 @@ class RSSService:
         for field in date_fields:
             date_str = entry.get(field, '')
             if date_str:
-                # Normalize timezone format: GMT+7 -> +07, GMT-5 -> -05
-                date_str = re.sub(r'GMT\+(\d{1,2})', r'+\1', date_str)
-                date_str = re.sub(r'GMT-(\d{1,2})', r'-\1', date_str)
+                # Normalize timezone format: GMT+7 -> +7, GMT-5 -> -5
+                date_str = _GMT_OFFSET_RE.sub(r'\1\2', date_str)
                 
                 try:
                     parsed_date = dateutil_parser.parse(date_str)
@@ -542,7 +638,7 @@ class RSSService:
             content = self._safe_get_string(entry, field)
             if content:
                 # Look for img tags
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(content, 'lxml')
                 img_tag = soup.find('img')
                 if img_tag and img_tag.get('src'):
                     return img_tag.get('src')
@@ -584,16 +680,16 @@ class RSSService:
             return ""
         
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove HTML comments
-        text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
+        text = _HTML_COMMENT_RE.sub('', text)
         
         # Clean up line breaks
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         
         # Remove multiple consecutive line breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -665,13 +761,11 @@ class RSSService:
         return str(soup)
     
 
-    def _extract_main_image_url_from_html(self, html: str, base_url: str) -> Optional[str]:
+    def _extract_main_image_url(self, soup: BeautifulSoup, base_url: str) -> Optional[str]:
         """
-        Extract the main image URL from HTML content.
+        Extract the main image URL from a parsed HTML page.
         """
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            
             # Look for Open Graph image
             og_image = soup.find('meta', property='og:image')
             if og_image and og_image.get('content'):
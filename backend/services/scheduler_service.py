@@ -4,29 +4,37 @@ Scheduler service for managing cronjobs.
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
 
-from database import get_db
-from services.rss_service import RSSService
-from models.database import NewsArticle
+from database import run_db, session_scope
+from lib.cache import invalidate_feed_caches
+from lib.utils import count_words
+from services.rss_service import EXTRACTION_RETRY_COOLDOWN, RSSService
+from models.database import NewsArticle, FeedFetchLog
 
 logger = logging.getLogger(__name__)
 
+# Feed fetch logs older than this are pruned, in chunks to keep each transaction small
+FETCH_LOG_RETENTION_DAYS = 90
+FETCH_LOG_PRUNE_BATCH_SIZE = 5000
+
 
 class SchedulerService:
     """Service for managing scheduled tasks."""
     
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+        # Created in start() so it binds to the event loop FastAPI is running on
+        self.scheduler: Optional[AsyncIOScheduler] = None
         self.is_running = False
     
     def start(self):
-        """Start the scheduler."""
+        """Start the scheduler on the running event loop."""
         if not self.is_running:
+            self.scheduler = AsyncIOScheduler(event_loop=asyncio.get_running_loop())
             self.scheduler.start()
             self.is_running = True
             logger.info("Scheduler started")
@@ -34,11 +42,13 @@ class SchedulerService:
             # Add the cronjobs
             self._add_feed_fetching_job()
             self._add_content_extraction_job()
+            self._add_fetch_log_pruning_job()
     
     def stop(self):
         """Stop the scheduler."""
-        if self.is_running:
-            self.scheduler.shutdown()
+        if self.is_running and self.scheduler is not None:
+            # Don't block shutdown waiting for an in-flight fetch to finish
+            self.scheduler.shutdown(wait=False)
             self.is_running = False
             logger.info("Scheduler stopped")
     
@@ -66,83 +76,128 @@ class SchedulerService:
         )
         logger.info("Added content extraction job (every minute)")
     
+    def _add_fetch_log_pruning_job(self):
+        """Add the job to prune old feed fetch logs once a day."""
+        self.scheduler.add_job(
+            func=self._prune_fetch_logs_job,
+            trigger=CronTrigger(hour=3, minute=30),  # Daily at 03:30
+            id="prune_fetch_logs",
+            name="Prune old feed fetch logs",
+            replace_existing=True,
+            max_instances=1
+        )
+        logger.info(f"Added fetch log pruning job (daily, {FETCH_LOG_RETENTION_DAYS} day retention)")
+    
     async def _fetch_all_feeds_job(self):
         """Job to fetch all RSS feeds."""
         logger.info("---- Starting scheduled feed fetching job ----")
         try:
-            db = next(get_db())
-            service = RSSService(db)
-            result = await service.fetch_all_feeds()
+            with session_scope() as db:
+                service = RSSService(db)
+                result = await service.fetch_all_feeds()
+            invalidate_feed_caches()
             logger.info(f"Feed fetching completed: {result}")
         except Exception as e:
             logger.error(f"Error in feed fetching job: {e}")
-        finally:
-            if 'db' in locals():
-                db.close()
     
     async def _extract_content_job(self):
         """Job to extract content for articles that haven't been extracted."""
         logger.info("---- Starting scheduled content extraction job ----")
         try:
-            db = next(get_db())
-            
-            # Get the top 20 latest articles without content
-            articles_without_content = db.query(NewsArticle).filter(
-                (NewsArticle.content.is_(None)) | 
-                (NewsArticle.content == "") |
-                (NewsArticle.content == "None")
-            ).order_by(
-                NewsArticle.created_at.desc()
-            ).limit(20).all()
+            with session_scope() as db:
+                # Get the top 20 latest articles without content, skipping those
+                # whose last attempt failed within the retry cooldown. Only the
+                # columns the job reads are selected
+                retry_before = datetime.now() - EXTRACTION_RETRY_COOLDOWN
+                pending_query = select(NewsArticle.id, NewsArticle.link, NewsArticle.image_url).filter(
+                    (NewsArticle.content.is_(None)) | 
+                    (NewsArticle.content == "") |
+                    (NewsArticle.content == "None"),
+                    (NewsArticle.extraction_attempted_at.is_(None)) |
+                    (NewsArticle.extraction_attempted_at < retry_before)
+                ).order_by(
+                    NewsArticle.created_at.desc()
+                ).limit(20)
+                # Queries and commits run in the threadpool, off the event loop
+                articles_without_content = await run_db(lambda: db.execute(pending_query).all())
             
-            if not articles_without_content:
-                logger.info("No articles found that need content extraction")
-                return
+                if not articles_without_content:
+                    logger.info("No articles found that need content extraction")
+                    return
             
-            logger.info(f"Found {len(articles_without_content)} articles that need content extraction")
+                logger.info(f"Found {len(articles_without_content)} articles that need content extraction")
             
-            service = RSSService(db)
-            extracted_count = 0
-            
-            for article in articles_without_content:
-                try:
-                    if not getattr(article, 'link', None):
+                # The attempt is recorded whatever the outcome, so failures wait out the cooldown
+                now = datetime.now()
+                updates = []
+                articles_with_link = []
+                for article in articles_without_content:
+                    if article.link:
+                        articles_with_link.append(article)
+                    else:
                         logger.warning(f"Article {article.id} has no link, skipping")
-                        continue
-                    
-                    logger.info(f"Extracting content for article {article.id}: {article.title}")
-                    content, extracted_image_url = await service.extract_article_content(getattr(article, 'link'))
-                    
+                        updates.append({"id": article.id, "extraction_attempted_at": now})
+                
+                # Pages are downloaded concurrently (bounded by the service)
+                service = RSSService(db)
+                results = await service.extract_articles_content(
+                    [article.link for article in articles_with_link]
+                )
+                
+                extracted_count = 0
+                for article, (content, extracted_image_url) in zip(articles_with_link, results):
+                    values = {"id": article.id, "extraction_attempted_at": now, "updated_at": now}
                     if content:
-                        setattr(article, 'content', content)
+                        values["content"] = content
+                        values["content_word_count"] = count_words(content)
                         extracted_count += 1
                         logger.info(f"Successfully extracted content for article {article.id}")
                     
-                    if extracted_image_url and not getattr(article, 'image_url', None):
-                        setattr(article, 'image_url', extracted_image_url)
+                    if extracted_image_url and not article.image_url:
+                        values["image_url"] = extracted_image_url
                         logger.info(f"Updated image URL for article {article.id}")
                     
-                    # Update the article timestamp
-                    setattr(article, 'updated_at', datetime.now())
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting content for article {article.id}: {e}")
-                    continue
+                    updates.append(values)
+                
+                # One bulk UPDATE by primary key (executemany per set of columns)
+                # instead of a flushed UPDATE per article
+                await run_db(db.execute, update(NewsArticle), updates)
+                await run_db(db.commit)
             
-            # Commit all changes
-            db.commit()
             logger.info(f"Content extraction job completed. Extracted content for {extracted_count} articles")
             
         except Exception as e:
             logger.error(f"Error in content extraction job: {e}")
-        finally:
-            if 'db' in locals():
-                db.close()
+    
+    def _prune_fetch_logs_job(self):
+        """
+        Job to delete feed fetch logs past the retention window.
+        Synchronous on purpose: APScheduler runs it in its thread pool, off the event loop.
+        """
+        logger.info("---- Starting scheduled fetch log pruning job ----")
+        cutoff = datetime.now() - timedelta(days=FETCH_LOG_RETENTION_DAYS)
+        deleted_count = 0
+        try:
+            while True:
+                # One short transaction per chunk (uses idx_log_timestamp)
+                with session_scope() as db:
+                    expired_ids = db.query(FeedFetchLog.id).filter(
+                        FeedFetchLog.fetch_timestamp < cutoff
+                    ).limit(FETCH_LOG_PRUNE_BATCH_SIZE).subquery()
+                    deleted = db.query(FeedFetchLog).filter(
+                        FeedFetchLog.id.in_(db.query(expired_ids.c.id))
+                    ).delete(synchronize_session=False)
+                deleted_count += deleted
+                if deleted < FETCH_LOG_PRUNE_BATCH_SIZE:
+                    break
+            logger.info(f"Fetch log pruning completed. Deleted {deleted_count} logs older than {cutoff}")
+        except Exception as e:
+            logger.error(f"Error in fetch log pruning job: {e}")
     
     def get_job_status(self) -> dict:
         """Get the status of all scheduled jobs."""
         jobs = []
-        for job in self.scheduler.get_jobs():
+        for job in (self.scheduler.get_jobs() if self.scheduler is not None else []):
             jobs.append({
                 "id": job.id,
                 "name": job.name,
@@ -11,6 +11,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
 
 class BaseSiteExtractor(ABC):
     """Base class for site-specific content extractors."""
@@ -29,7 +32,7 @@ class BaseSiteExtractor(ABC):
         content = self._sanitize_html_attributes(content)
         
         # Remove excessive whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
         
         # Add line breaks for better readability
         content = content.replace('</p>', '</p>\n\n')
@@ -46,7 +49,7 @@ class BaseSiteExtractor(ABC):
         content = content.replace('</blockquote>', '</blockquote>\n\n')
         
         # Clean up multiple line breaks
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _EXCESS_NEWLINES_RE.sub('\n\n', content)
         
         return content.strip()
     
@@ -23,17 +23,16 @@ else
     echo "Persistent disk not found, using local storage"
 fi
 
-# Check if DATABASE_URL is set
-if [ -z "$DATABASE_URL" ]; then
-    echo "Setting default DATABASE_URL..."
-    export DATABASE_URL="sqlite:///./news_4u.db"
+# DATABASE_URL overrides the default location chosen above
+if [ -n "$DATABASE_URL" ]; then
+    echo "Using DATABASE_URL from the environment"
 fi
 
 # Activate virtual environment
 echo "Activating virtual environment..."
 source venv/bin/activate
 
-echo "Starting FastAPI server with DATABASE_URL: $DATABASE_URL"
+echo "Starting FastAPI server with DATABASE_URL: ${DATABASE_URL:-default}"
 echo "Server will be available at: http://localhost:8000"
 echo "Press Ctrl+C to stop the server"
 echo ""
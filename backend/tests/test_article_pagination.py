@@ -0,0 +1,94 @@
+"""
+Keyset pagination regression tests for the article listing endpoints.
+
+Run from the backend directory: python -m unittest discover tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_tmpdir = tempfile.TemporaryDirectory()
+
+
+def setUpModule():
+    global client
+    # Point database.py at a throwaway file before it builds its engine; without
+    # this it would pick /app/data/news_4u.db wherever that directory exists
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir.name, 'test.db')}"
+    from fastapi.testclient import TestClient
+    from database import init_db, session_scope
+    from sqlalchemy import text
+    import main
+
+    init_db()
+    with session_scope() as db:
+        db.execute(text(
+            "INSERT INTO rss_feeds (name, url, category, is_active) VALUES ('Source', 'http://feed', 'Tech', 1)"
+        ))
+        # Rows sharing published_date and created_at second, stored in both
+        # formats SQLite ends up with: server_default 'YYYY-MM-DD HH:MM:SS' and
+        # Python datetimes with microseconds
+        for i in range(30):
+            created_at = "2025-02-01 00:00:00" if i % 2 else "2025-02-01 00:00:00.000000"
+            published_date = None if i % 5 == 0 else f"2025-01-0{1 + i % 3} 00:00:00.000000"
+            db.execute(text("""
+                INSERT INTO news_articles (title, link, link_hash, category, source_name, slug,
+                                           is_processed, published_date, created_at)
+                VALUES (:title, :link, :link_hash, 'Tech', 'Source', :slug, 1, :published_date, :created_at)
+            """), {
+                "title": f"Article {i}", "link": f"http://article/{i}", "link_hash": i, "slug": f"article-{i}",
+                "published_date": published_date, "created_at": created_at,
+            })
+    # No context manager: the lifespan (feed seeding, scheduler) isn't needed
+    client = TestClient(main.app)
+
+
+def tearDownModule():
+    os.environ.pop("DATABASE_URL", None)
+    _tmpdir.cleanup()
+
+
+class KeysetPaginationTest(unittest.TestCase):
+
+    def _offset_ids(self, per_page):
+        ids, page = [], 1
+        while True:
+            articles = client.get(f"/api/news/articles?per_page={per_page}&page={page}").json()["articles"]
+            if not articles:
+                return ids
+            ids += [article["id"] for article in articles]
+            page += 1
+
+    def _cursor_ids(self, per_page):
+        ids, cursor = [], None
+        # Bounded: a seek that misorders rows can hand back a cursor to a page seen before
+        for _ in range(100):
+            url = f"/api/news/articles?per_page={per_page}&include_total=false"
+            response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            ids += [article["id"] for article in data["articles"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                return ids
+        self.fail("cursor pagination did not terminate")
+
+    def test_cursor_pages_match_offset_pages_with_mixed_timestamp_formats(self):
+        for per_page in (1, 2, 7):
+            with self.subTest(per_page=per_page):
+                cursor_ids = self._cursor_ids(per_page)
+                self.assertEqual(len(cursor_ids), 30)
+                self.assertEqual(len(set(cursor_ids)), 30)
+                self.assertEqual(cursor_ids, self._offset_ids(per_page))
+
+    def test_invalid_cursor_is_rejected(self):
+        response = client.get("/api/news/articles?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
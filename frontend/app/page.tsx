@@ -2,7 +2,7 @@
 
 import { useState, useEffect, Suspense } from 'react';
 import { useRouter, useSearchParams } from 'next/navigation';
-import { newsApi, NewsArticle } from '@/lib/api';
+import { getArticleListTotal, newsApi, NewsArticle } from '@/lib/api';
 import { Newspaper, Search, Globe, Laptop, Flag } from 'lucide-react';
 import SearchBar from '@/components/SearchBar';
 import Pagination from '@/components/Pagination';
@@ -150,7 +150,7 @@ function HomePageContent() {
       }
       const articlesData = await newsApi.getArticles(params);
       setArticles(articlesData.articles);
-      setTotalArticles(articlesData.total);
+      setTotalArticles(getArticleListTotal(articlesData));
       setCurrentPage(page);
     } catch (error) {
       // Error handling
@@ -212,7 +212,7 @@ function HomePageContent() {
       });
 
       setSearchResults(result.articles);
-      setSearchTotal(result.total);
+      setSearchTotal(getArticleListTotal(result));
       saveStateToStorage();
       updateURLWithState();
     } catch (error) {
@@ -236,7 +236,7 @@ function HomePageContent() {
       });
 
       setSearchResults(result.articles);
-      setSearchTotal(result.total);
+      setSearchTotal(getArticleListTotal(result));
       setCurrentPage(page);
       saveStateToStorage();
       updateURLWithState();
@@ -279,7 +279,7 @@ function HomePageContent() {
 
       const articlesData = await newsApi.getArticles(params);
       setArticles(articlesData.articles);
-      setTotalArticles(articlesData.total);
+      setTotalArticles(getArticleListTotal(articlesData));
       setCurrentPage(1);
       saveStateToStorage();
       updateURLWithState();
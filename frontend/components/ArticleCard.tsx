@@ -2,7 +2,7 @@
 
 import { useState } from 'react';
 import { NewsArticle } from '@/lib/api';
-import { calculateReadTime, formatRelativeTime, getCategoryColor, getCategoryIcon, getSourceIcon, truncateWords } from '@/lib/utils';
+import { calculateReadTime, formatRelativeTime, readTimeFromWordCount, getCategoryColor, getCategoryIcon, getSourceIcon, truncateWords } from '@/lib/utils';
 import { Dot, Loader2, Clock } from 'lucide-react';
 
 interface ArticleCardProps {
@@ -13,8 +13,11 @@ interface ArticleCardProps {
 
 export default function ArticleCard({ article, onArticleClick, isLoading = false }: ArticleCardProps) {
   const [imageError, setImageError] = useState(false);
-  const hasContent = article.content && article.content.length > 0;
-  const readTime = hasContent && article.content ? calculateReadTime(article.content) : 0;
+  // List endpoints send content_word_count instead of the full content
+  const hasContent = (article.content && article.content.length > 0) || !!article.content_word_count;
+  const readTime = article.content
+    ? calculateReadTime(article.content)
+    : article.content_word_count ? readTimeFromWordCount(article.content_word_count) : 0;
   const handleClick = () => {
     if (!isLoading) {
       onArticleClick(article);
@@ -49,16 +49,28 @@ export interface NewsArticle {
   is_processed: boolean;
   created_at: string;
   updated_at?: string;
+  content_word_count?: number;
 }
 
 export interface NewsArticleList {
   articles: NewsArticle[];
-  total: number;
+  // null when the request passed include_total=false
+  total?: number | null;
   page: number;
   per_page: number;
-  total_pages: number;
+  total_pages?: number | null;
+  has_next: boolean;
+  has_prev: boolean;
+  // Keyset cursor for the next page (pass as `cursor`); null on the last page
+  next_cursor?: string | null;
 }
 
+// Total for pagination. Without a count, fall back to the articles seen so far,
+// plus one when another page exists so the next page stays reachable
+export const getArticleListTotal = (list: NewsArticleList): number =>
+  list.total ??
+  (list.page - 1) * list.per_page + list.articles.length + (list.has_next ? 1 : 0);
+
 export interface RSSFeed {
   id: number;
   name: string;
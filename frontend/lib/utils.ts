@@ -91,8 +91,13 @@ export function formatDate(dateString: string): string {
   });
 }
 
+const WORDS_PER_MINUTE = 200;
+
 export function calculateReadTime(content: string): number {
-  const wordsPerMinute = 200;
   const words = content.trim().split(/\s+/).length;
-  return Math.ceil(words / wordsPerMinute);
+  return readTimeFromWordCount(words);
+}
+
+export function readTimeFromWordCount(words: number): number {
+  return Math.ceil(words / WORDS_PER_MINUTE);
 } 
\ No newline at end of file